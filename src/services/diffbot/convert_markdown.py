@@ -1,104 +1,210 @@
-import json
+import orjson
 import os
 from datetime import datetime
 import glob
-import mistune
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from dataclasses import dataclass
+from typing import List
 
-class TEArticleRenderer(mistune.HTMLRenderer):
-    """Custom renderer for Trading Economics articles"""
+try:
+    # RE2 compiles the alternation into a single linear-time automaton
+    import re2 as re
+except ImportError:
+    import re
+
+try:
+    # Only the byte-level summary scan is compiled; the parser stays plain Python
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# One pattern for the three line kinds in the Trading Economics stream markdown:
+# bold title links, stream?i= category links and "... ago" timestamps. Links
+# may sit anywhere on a line (the category badge follows the country badge),
+# so lines are scanned with finditer. The timestamp must be a standalone
+# relative time ("44 hours ago", "a day ago"), either as the whole line or as
+# the text left after the badge links, so body sentences ending in "ago" stay body.
+LINE_RE = re.compile(
+    r'\[\*\*(?P<title>.+?)\*\*\]\((?P<turl>/[^)]+)\)'
+    r'|\[(?P<cat>[^\]]+)\]\([^)]*stream\?i=[^)]*\)'
+    r'|^(?P<ago>(?:\d+|an?)\s+(?:second|minute|hour|day|week|month|year)s?\s+ago)\s*$'
+)
+
+# Inline links in body text (e.g. stock symbols), reduced to their link text
+INLINE_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+
+# Last line of the site navigation that precedes the news stream
+NAV_MARKER = '- united states\n\n'
+
+SUMMARY_LENGTH = 200
+
+@njit(cache=True)
+def find_summary_end(buf, cap):
+    """Return the byte offset of the last space within the first `cap`
+    code points of UTF-8 `buf`, or of the cap itself if there is none"""
+    chars = 0
+    last_space = -1
+    i = 0
+    n = len(buf)
+    while i < n:
+        byte = buf[i]
+        if (byte & 0xC0) != 0x80:
+            # Lead byte of a new code point
+            if chars == cap:
+                if byte == 32:
+                    # The cap lands exactly at the end of a word
+                    last_space = i
+                break
+            chars += 1
+            if byte == 32:
+                last_space = i
+        i += 1
+    if i == n:
+        return n
+    if last_space > 0:
+        return last_space
+    return i
+
+def summarize(content: str) -> str:
+    """Cut content to at most SUMMARY_LENGTH characters on a word boundary"""
+    if len(content) <= SUMMARY_LENGTH:
+        # Already short enough: reuse the string instead of encoding and slicing
+        return content
+    buf = content.encode('utf-8')
+    data = np.frombuffer(buf, dtype=np.uint8) if np is not None else buf
+    return buf[:find_summary_end(data, SUMMARY_LENGTH)].decode('utf-8')
+
+@dataclass(slots=True)
+class Article:
+    """A single Trading Economics stream article"""
+    title: str
+    url: str
+    content: str = ''
+    category: str = 'Market News'
+    published_at: str = ''
+    source: str = 'Trading Economics'
+    author: str = 'Trading Economics'
+    summary: str = ''
+
+ARTICLE_BASE_URL = 'https://tradingeconomics.com'
+
+def build_article(title: str, url: str, category: str, published_at: str, content_parts: List[str]) -> Article:
+    """Join the collected body lines and build the finished article
+    
+    An empty entry in content_parts marks a blank line, so lines of one
+    paragraph are joined by a newline and paragraphs by a blank line.
+    """
+    content = '\n'.join(content_parts).strip()
+    return Article(
+        title=title,
+        url=url,
+        content=content,
+        category=category,
+        published_at=published_at,
+        summary=summarize(content)
+    )
+
+def strip_links(text: str) -> str:
+    """Replace markdown inline links with their text"""
+    return INLINE_LINK_RE.sub(r'\1', text)
+
+def parse_articles(markdown_text: str) -> List[Article]:
+    """Scan the markdown once, dispatching each line by kind
     
-    def __init__(self):
-        super().__init__()
-        self.current_article = None
-        self.articles = []
+    The current article lives in local variables and is built once when
+    the next title (or the end of the text) is reached.
+    """
+    articles = []
+    find_kinds = LINE_RE.finditer
+    title = url = None
+    category, published_at, content_parts = 'Market News', '', []
+    
+    for line in markdown_text.splitlines():
+        line = line.strip()
+        if not line:
+            # Paragraph break; collapse runs of blank lines into one
+            if content_parts and content_parts[-1]:
+                content_parts.append('')
+            continue
         
-    def link(self, text: str, url: str, title: str = None) -> str:
-        """Handle links which often indicate article titles or categories"""
-        if text.startswith('**') and text.endswith('**'):
-            # This is an article title
-            if self.current_article:
-                self.articles.append(self.current_article)
-            
-            self.current_article = {
-                'title': text.strip('*'),
-                'url': f"https://tradingeconomics.com{url}",
-                'content': '',
-                'category': 'Market News',
-                'published_at': '',
-                'source': 'Trading Economics',
-                'author': 'Trading Economics',
-                'summary': ''
-            }
-        elif 'stream?i=' in url:
-            # This is a category
-            if self.current_article:
-                self.current_article['category'] = text.strip('[]').replace('+', ' ')
+        match = None
+        for match in find_kinds(line):
+            if match.lastgroup == 'turl':
+                if title is not None:
+                    articles.append(build_article(title, url, category, published_at, content_parts))
+                title, url = match.group('title'), ARTICLE_BASE_URL + match.group('turl')
+                category, published_at, content_parts = 'Market News', '', []
+            elif title is None:
+                continue
+            elif match.lastgroup == 'cat':
+                category = match.group('cat').strip('[]').replace('+', ' ')
+            else:
+                published_at = match.group('ago')
         
-        return ''
-    
-    def paragraph(self, text: str) -> str:
-        """Handle paragraphs which contain the main content"""
-        if self.current_article:
-            if text.endswith('ago'):
-                self.current_article['published_at'] = text.strip()
-            elif not text.startswith('[United States]'):
-                if self.current_article['content']:
-                    self.current_article['content'] += '\n\n'
-                self.current_article['content'] += text
-        return ''
+        if match is None:
+            if title is not None and not line.startswith('[United States]'):
+                content_parts.append(strip_links(line))
+        elif title is not None and match.end() < len(line):
+            # A timestamp may trail the badge links on the same line
+            tail = LINE_RE.match(line[match.end():].strip())
+            if tail and tail.lastgroup == 'ago':
+                published_at = tail.group('ago')
     
-    def get_articles(self) -> List[Dict[str, Any]]:
-        """Get all processed articles"""
-        if self.current_article:
-            self.articles.append(self.current_article)
-            
-        # Process summaries and clean up
-        for article in self.articles:
-            article['summary'] = article['content'][:200] if article['content'] else ''
-            article['content'] = article['content'].strip()
-            
-        return self.articles
+    if title is not None:
+        articles.append(build_article(title, url, category, published_at, content_parts))
+    return articles
 
-def convert_markdown_to_articles(markdown_text: str) -> List[Dict[str, Any]]:
+def convert_markdown_to_articles(markdown_text: str) -> List[Article]:
     """Convert markdown text to structured articles"""
-    # Skip navigation section
-    if '- united states\n\n' in markdown_text:
-        markdown_text = markdown_text.split('- united states\n\n')[1]
-    
-    # Create renderer and markdown parser
-    renderer = TEArticleRenderer()
-    markdown = mistune.create_markdown(renderer=renderer)
+    # Skip navigation section with a single find rather than split()
+    nav_end = markdown_text.find(NAV_MARKER)
+    if nav_end != -1:
+        markdown_text = markdown_text[nav_end + len(NAV_MARKER):]
     
-    # Parse markdown
-    markdown(markdown_text)
-    
-    # Get processed articles
-    return renderer.get_articles()
+    # Scan markdown line by line
+    return parse_articles(markdown_text)
 
-def convert_file(input_file: str) -> bool:
-    """Convert a single FireCrawl markdown file to JSON"""
+def convert_file(input_file: str, verbose: bool = True) -> bool:
+    """Convert a single FireCrawl markdown file to JSON
+    
+    With verbose off the multi-line article preview is skipped, so output
+    from parallel workers stays readable.
+    """
     try:
         print(f"\nProcessing: {input_file}")
         
         # Read the original file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            data = orjson.loads(f.read())
             
         if not data.get('success') or 'data' not in data:
             print(f"Invalid file format: {input_file}")
             return False
             
+        page = data.get('data')
+        markdown_text = (page.get('markdown') if isinstance(page, dict) else None) or ''
+        if not markdown_text.strip():
+            print(f"No markdown content in {input_file}")
+            return False
+            
         # Convert markdown to articles
-        articles = convert_markdown_to_articles(data['data']['markdown'])
+        articles = convert_markdown_to_articles(markdown_text)
         
         if not articles:
             print(f"No articles found in {input_file}")
             return False
             
-        # Create output filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f'processed_articles_{timestamp}.json'
+        # Create output filename; the source stamp keeps files converted
+        # in the same second from overwriting each other
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        source_stamp = os.path.basename(input_file).removeprefix('economic_news_').removesuffix('.json')
+        output_file = f'processed_articles_{timestamp}_{source_stamp}.json'
         
         # Save processed articles
         output = {
@@ -106,21 +212,22 @@ def convert_file(input_file: str) -> bool:
             "articles": articles,
             "metadata": {
                 "total_articles": len(articles),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "source": "Trading Economics",
                 "original_file": os.path.basename(input_file)
             }
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output))
             
         print(f"\n✨ Processed {len(articles)} articles")
-        for article in articles[:2]:  # Show first 2 articles
-            print(f"\n📰 {article['title']}")
-            print(f"   Category: {article['category']}")
-            print(f"   Published: {article['published_at']}")
-            print(f"   Content: {article['content'][:100]}...")
+        if verbose:
+            for article in articles[:2]:  # Show first 2 articles
+                print(f"\n📰 {article.title}")
+                print(f"   Category: {article.category}")
+                print(f"   Published: {article.published_at}")
+                print(f"   Content: {article.content[:100]}...")
             
         print(f"\n📝 Saved to: {output_file}")
         return True
@@ -133,23 +240,18 @@ def main():
     """Process all economic news files in the directory"""
     print("🔍 Looking for economic news files...")
     
-    # Find all economic news files
-    files = glob.glob('economic_news_*.json')
-    files = [f for f in files if not f.endswith('_processed.json')]
+    # Stream matching file names instead of building and filtering a list
+    files = (f for f in glob.iglob('economic_news_*.json') if not f.endswith('_processed.json'))
     
-    if not files:
+    # Files are independent, so convert them in parallel across cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(partial(convert_file, verbose=False), files, chunksize=4))
+    
+    if not results:
         print("No economic news files found!")
         return
     
-    print(f"Found {len(files)} files to process")
-    
-    # Process each file
-    success_count = 0
-    for file in files:
-        if convert_file(file):
-            success_count += 1
-    
-    print(f"\n✨ Successfully processed {success_count} of {len(files)} files")
+    print(f"\n✨ Successfully processed {sum(results)} of {len(results)} files")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
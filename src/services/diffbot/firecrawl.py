@@ -1,16 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import orjson
 import os
 from datetime import datetime
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from lxml import html
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from te_http import SESSION, STREAM_TITLE_XPATH, get_driver, quit_driver
+from convert_markdown import convert_markdown_to_articles
 
 # Load environment variables
 load_dotenv()
@@ -25,23 +22,42 @@ FIRECRAWL_KEY = "fc-81208c70fa434b9bb10973f99c7e3115"
 # According to the documentation example, use this endpoint:
 FIRECRAWL_BASE_URL = "https://api.firecrawl.dev/v1"
 FIRECRAWL_SCRAPE_URL = f"{FIRECRAWL_BASE_URL}/scrape"
+# Sent per request rather than on SESSION so the key never reaches other hosts
+FIRECRAWL_HEADERS = {
+    "Authorization": f"Bearer {FIRECRAWL_KEY}",
+    "Content-Type": "application/json"
+}
 
 def get_top_news_item():
+    """
+    Returns the top news item title and URL, reading the server-rendered
+    stream page directly and only falling back to Selenium when it lacks titles.
+    """
+    try:
+        print(f"Fetching news feed page: {NEWS_URL}")
+        response = SESSION.get(NEWS_URL, timeout=10)
+        response.raise_for_status()
+
+        news_items = html.fromstring(response.content).xpath(STREAM_TITLE_XPATH)
+        if news_items:
+            title = news_items[0].text_content().strip()
+            print(f"\nFound news feed with first item: '{title}'")
+            print(f"URL: {NEWS_URL}\n")
+            return title, NEWS_URL
+
+        print("No news items in static HTML, falling back to Selenium...")
+    except Exception as e:
+        print(f"Error fetching static page: {e}")
+
+    return get_top_news_item_selenium()
+
+def get_top_news_item_selenium():
     """
     Fetches the page using Selenium and returns the top news item title and URL.
     """
-    driver = None
     try:
         print("Setting up Chrome driver...")
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = get_driver()
         
         # Use the main news feed URL instead of specific news item
         news_feed_url = "https://tradingeconomics.com/stream?c=united+states"
@@ -70,11 +86,9 @@ def get_top_news_item():
         
     except Exception as e:
         print(f"Error with Selenium: {e}")
+        # Drop the session so the next call starts a fresh browser
+        quit_driver()
         return None, None
-        
-    finally:
-        if driver:
-            driver.quit()
 
 def load_last_news():
     """
@@ -85,8 +99,8 @@ def load_last_news():
         return None, None
         
     try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(DATA_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
             print(f"Last saved news: '{data.get('title')}'")
             return data.get('title'), data.get('url')
     except Exception as e:
@@ -98,13 +112,13 @@ def save_last_news(title, url):
     Saves the current news item
     """
     try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
+        with open(DATA_FILE, 'wb') as f:
             data = {
                 'title': title, 
                 'url': url,
                 'last_checked': datetime.now().isoformat()
             }
-            json.dump(data, f, indent=2)
+            f.write(orjson.dumps(data))
             print("News saved successfully")
     except Exception as e:
         print(f"Error saving news: {e}")
@@ -114,10 +128,6 @@ def extract_with_firecrawl(url):
     Extract content using FireCrawl with minimal schema to get raw markdown
     """
     print("\nExtracting content with FireCrawl...")
-    headers = {
-        "Authorization": f"Bearer {FIRECRAWL_KEY}",
-        "Content-Type": "application/json"
-    }
 
     # Simplified payload without schema to get raw content
     payload = {
@@ -127,34 +137,42 @@ def extract_with_firecrawl(url):
         "timeout": 30000
     }
     
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f'economic_news_{timestamp}.json'
+    
     try:
         print(f"Calling FireCrawl API for URL: {url}")
         print(f"Full API URL: {FIRECRAWL_SCRAPE_URL}")
         
-        response = requests.post(FIRECRAWL_SCRAPE_URL, headers=headers, json=payload)
-        response.raise_for_status()
+        # Stream the body straight to disk rather than buffering and re-serializing it
+        with SESSION.post(FIRECRAWL_SCRAPE_URL, headers=FIRECRAWL_HEADERS, data=orjson.dumps(payload), stream=True) as response:
+            if not response.ok:
+                print(f"Response: {response.text}")
+            response.raise_for_status()
+            
+            with open(filename, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
         
-        structured_data = response.json()
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        structured_data = orjson.loads(raw)
         
         if not structured_data.get('success', False):
             raise Exception(f"FireCrawl API error: {structured_data.get('error', 'Unknown error')}")
         
+        # Preview the bytes as received instead of re-serializing the whole payload
         print("\n📊 FireCrawl Response Preview:")
-        print(json.dumps(structured_data, indent=2)[:500] + "...")
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'economic_news_{timestamp}.json'
-        
-        with open(filename, 'w') as f:
-            json.dump(structured_data, f, indent=2)
+        print(raw[:500].decode('utf-8', errors='replace') + "...")
             
         print(f"\nExtracted data saved to {filename}")
         return structured_data
         
     except Exception as e:
         print(f"\n❌ Error with FireCrawl extraction: {e}")
-        if hasattr(e, 'response'):
-            print(f"Response: {e.response.text}")
+        # Don't leave a partial or failed response for convert_markdown to pick up
+        if os.path.exists(filename):
+            os.remove(filename)
         return None
 
 def convert_and_save_articles(markdown_data, output_file=None):
@@ -163,7 +181,8 @@ def convert_and_save_articles(markdown_data, output_file=None):
     """
     try:
         # Parse articles from markdown
-        articles = parse_articles_from_markdown(markdown_data)
+        articles = convert_markdown_to_articles(markdown_data)
+        now = datetime.now()
         
         # Create output structure
         output = {
@@ -171,19 +190,19 @@ def convert_and_save_articles(markdown_data, output_file=None):
             "articles": articles,
             "metadata": {
                 "total_articles": len(articles),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "source": "Trading Economics"
             }
         }
         
         # Generate filename with timestamp if not provided
         if not output_file:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             output_file = f'processed_articles_{timestamp}.json'
         
         # Save to JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output))
             
         print(f"\n✨ Processed {len(articles)} articles")
         print(f"📝 Saved to: {output_file}")
@@ -0,0 +1,59 @@
+# Shared HTTP and browser plumbing for the Trading Economics scrapers
+# (firecrawl.py and scraper.py)
+import atexit
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# XPath equivalent of the .te-stream-title CSS selector
+STREAM_TITLE_XPATH = "//*[contains(concat(' ', normalize-space(@class), ' '), ' te-stream-title ')]"
+
+# Pooled session so repeat calls reuse TCP/TLS connections; transient 5xx are retried
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+def get_driver():
+    """
+    Returns the shared headless Chrome driver, starting it on first use.
+    """
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is None:
+            chrome_options = Options()
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument(f"user-agent={USER_AGENT}")
+
+            # Selenium Manager resolves and caches chromedriver itself
+            _DRIVER = webdriver.Chrome(options=chrome_options)
+        return _DRIVER
+
+def quit_driver():
+    """
+    Shuts down the shared Chrome driver if one is running.
+    """
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                _DRIVER.quit()
+            except Exception:
+                # The browser may already be gone; nothing left to clean up
+                pass
+            _DRIVER = None
+
+atexit.register(quit_driver)
@@ -0,0 +1,114 @@
+"""Regression checks for convert_markdown; run directly or with pytest"""
+import os
+import tempfile
+from convert_markdown import (
+    SUMMARY_LENGTH, convert_file, convert_markdown_to_articles, find_summary_end, np, summarize
+)
+
+# Multi-byte text, unbroken text, a word ending exactly at the cap, and ordinary prose
+SUMMARY_SAMPLES = (
+    'é' * 250,
+    'x' * 250,
+    'a' * 195 + ' word more text',
+    'a' * 199 + ' tail',
+    'word ' * 60,
+)
+
+# Layout of a stream item as FireCrawl renders page_source.html
+STREAM_MARKDOWN = """- united states
+
+[**The Dow Jones Index Closes 1.21% Higher**](/indu:ind)
+
+[United States](/stream?c=united+states) [Stock Market](/stream?i=stock+market)
+
+In New York, the Dow Jones Index went up by 510 points or 1.21 percent on Friday.
+
+44 hours ago
+
+[**US 10-Year Yield Rises**](/united-states/government-bond-yield) [Bonds](/stream?i=bonds)
+
+Yields rose.
+"""
+
+def test_category_badge_after_country_badge():
+    articles = convert_markdown_to_articles(STREAM_MARKDOWN)
+    assert articles[0].title == 'The Dow Jones Index Closes 1.21% Higher'
+    assert articles[0].category == 'Stock Market'
+    assert articles[0].published_at == '44 hours ago'
+    assert articles[0].content == 'In New York, the Dow Jones Index went up by 510 points or 1.21 percent on Friday.'
+
+def test_category_on_title_line():
+    articles = convert_markdown_to_articles(STREAM_MARKDOWN)
+    assert articles[1].title == 'US 10-Year Yield Rises'
+    assert articles[1].category == 'Bonds'
+
+def test_body_links_and_soft_wraps():
+    articles = convert_markdown_to_articles(
+        "[**Stocks Rally**](/united-states/stock-market)\n\n"
+        "Top gainers were [Nvidia](/nvda:us) (2.46%)\n"
+        "and [UnitedHealth](/unh:us) (2.37%).\n\n"
+        "Second paragraph.\n"
+    )
+    assert articles[0].content == (
+        'Top gainers were Nvidia (2.46%)\n'
+        'and UnitedHealth (2.37%).\n\n'
+        'Second paragraph.'
+    )
+
+def test_body_line_ending_in_ago_stays_body():
+    articles = convert_markdown_to_articles(
+        "[**Exports Grow**](/united-states/exports)\n\n"
+        "This grew from a year ago\n"
+        "and kept going.\n\n"
+        "3 hours ago\n"
+    )
+    assert articles[0].content == 'This grew from a year ago\nand kept going.'
+    assert articles[0].published_at == '3 hours ago'
+
+def test_timestamp_after_badges():
+    articles = convert_markdown_to_articles(
+        "[**Yields Fall**](/united-states/government-bond-yield)\n\n"
+        "[United States](/stream?c=us) [Bonds](/stream?i=bonds) 2 hours ago\n\n"
+        "Bond yields fell.\n"
+    )
+    assert articles[0].category == 'Bonds'
+    assert articles[0].published_at == '2 hours ago'
+    assert articles[0].content == 'Bond yields fell.'
+
+def test_convert_file_without_markdown():
+    for payload in (b'{"success": true, "data": null}', b'{"success": true, "data": "x"}', b'{"success": true, "data": {}}'):
+        with tempfile.NamedTemporaryFile('wb', suffix='.json', delete=False) as f:
+            f.write(payload)
+        try:
+            assert convert_file(f.name) is False
+        finally:
+            os.remove(f.name)
+
+def test_summary_counts_characters_not_bytes():
+    assert summarize('é' * 250) == 'é' * SUMMARY_LENGTH
+
+def test_summary_without_spaces_cuts_at_cap():
+    assert summarize('x' * 250) == 'x' * SUMMARY_LENGTH
+
+def test_summary_keeps_word_ending_at_cap():
+    assert summarize('a' * 195 + ' word more text') == 'a' * 195 + ' word'
+    assert summarize('a' * 199 + ' tail') == 'a' * 199
+    assert summarize('word ' * 60) == ('word ' * 40).rstrip()
+
+def test_summary_of_short_content_is_unchanged():
+    for content in ('', 'Short note.', 'y' * SUMMARY_LENGTH):
+        assert summarize(content) is content
+
+def test_summary_end_matches_pure_python():
+    # With numba installed this compares the compiled scan to the original function
+    pure = getattr(find_summary_end, 'py_func', find_summary_end)
+    for content in SUMMARY_SAMPLES:
+        buf = content.encode('utf-8')
+        data = np.frombuffer(buf, dtype=np.uint8) if np is not None else buf
+        assert find_summary_end(data, SUMMARY_LENGTH) == pure(buf, SUMMARY_LENGTH)
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith('test_'):
+            check()
+    print("✅ convert_markdown checks passed")